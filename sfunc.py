@@ -27,6 +27,8 @@ library.
 # NOTE: The original sfunc* functions from the main module are retained
 # in this module for compatibility purposes, and to serve as a historical
 # reference. It will be removed in future releases.
+import re
+from functools import lru_cache
 from warnings import warn
 
 warn('sfunc will be removed soon; use TextProcessor instead', DeprecationWarning)
@@ -37,19 +39,33 @@ SCOPE_STR = 'S'
 SCOPE_NOP = ''
 SUBPOINT = '\ufffc'
 iformat_default = SUBPOINT # nothing but a single SP
+FUSE_LIMIT = 0x10000 # max code points in a fused translation table
+compile_re = lru_cache(maxsize=1024)(re.compile)
+    # local copy of uilaat.compile_re(), as this module does not depend
+    # on the main module
+
+# Internal pseudo-scope for runs of character-scope functions that are
+# performed with a single str.translate() table by sfunc_from_list()
+_SCOPE_TRANS = 'T'
 
 def in_range(r_start, r_end, char):
     if (r_start is None) or (r_end is None):
         return True
     elif (r_start > r_end):
         warn('r_start is past r_end',  RuntimeWarning)
-    if len(char) > 1:
-        n = ord(char[0])
-    else:
-        n = ord(char)
-    return n >= r_start and n <= r_end
+    return r_start <= ord(char[0]) <= r_end
+
+def _range_bounds(r_start, r_end):
+    # Return the (start, end) code point range checked by char-scope
+    # functions, for use with inlined range checks, or None if the
+    # functions apply to all code points
+    if (r_start is None) or (r_end is None):
+        return None
+    elif (r_start > r_end):
+        warn('r_start is past r_end',  RuntimeWarning)
+    return (r_start, r_end)
 
-def sfunc_from_covar(r_start, r_end, offset):
+def sfunc_from_covar(r_start, r_end, offset, multicodepoint=True):
     """
     Create a Code Point Value Arithmetic substitution function.
     These are used for substitutions that can be performed by
@@ -69,6 +85,10 @@ def sfunc_from_covar(r_start, r_end, offset):
     * offset - (int) the value to add to or subtract from for an
         affected code point; use a negative int for subtraction
 
+    * multicodepoint - (bool) set to False if the function will only
+        be used on single code points, to skip checks and handling for
+        multi-code point characters
+
     Limitations
     -----------
     Handling of multi-code point characters is currently rather basic.
@@ -78,21 +98,42 @@ def sfunc_from_covar(r_start, r_end, offset):
 
     # TODO: Is there another way of performing this using
     # more built-in Python features or regular expressions?
-    def fn_covar(c):
-        if isinstance(c, str) is False:
-            raise TypeError('this function is only for characters')
-        if in_range(r_start, r_end, c):
+    bounds = _range_bounds(r_start, r_end)
+    if bounds is None:
+        lo, hi = (0, 0x10FFFF)
+    else:
+        lo, hi = bounds
+    if not multicodepoint:
+        if bounds is None:
+            def fn_covar(c):
+                return chr(ord(c)+offset)
+        else:
+            def fn_covar(c):
+                n = ord(c)
+                return chr(n+offset) if lo <= n <= hi else c
+    elif bounds is None:
+        def fn_covar(c):
             n = ord(c[0])
             if len(c) > 1:
                 return ''.join((chr(n+offset), c[1:],))
             else:
                 return chr(n+offset)
-        else:
-            return c
+    else:
+        def fn_covar(c):
+            n = ord(c[0])
+            if lo <= n <= hi:
+                if len(c) > 1:
+                    return ''.join((chr(n+offset), c[1:],))
+                else:
+                    return chr(n+offset)
+            else:
+                return c
 
+    if bounds is not None:
+        fn_covar.domain = range(lo, hi+1)
     return (fn_covar, SCOPE_CHAR,)
 
-def sfunc_from_dict(r_start, r_end, dic):
+def sfunc_from_dict(r_start, r_end, dic, multicodepoint=True):
     """
     Create a Dictionary Substitution function.
     These are used for substitutions where replacements for targeted
@@ -115,6 +156,10 @@ def sfunc_from_dict(r_start, r_end, dic):
         substitutions. Characters not targeted by the dictionary are
         copied over unchanged.
 
+    * multicodepoint - (bool) set to False if the function will only
+        be used on single code points, to skip checks for multi-code
+        point characters
+
     Limitations
     -----------
     Multi-code point characters and Multi-character targets are currenly
@@ -122,25 +167,85 @@ def sfunc_from_dict(r_start, r_end, dic):
     replacements are still supported.
     """
 
-    if isinstance(dic, dict) is False:
+    if not isinstance(dic, dict):
         raise TypeError('use only dicts with this substitution type')
 
-    def fn_dict(c):
-        if isinstance(c, str) is False:
-            raise TypeError('this function is only for characters')
-        elif len(c) > 1:
-            fmt = 'multi-char or multi-codepoint char {} not supported'
-            msg = fmt.format(c)
-            warn(msg, RuntimeWarning)
-        if in_range(r_start, r_end, c) is False:
-            return c
-        pre_out_default = dic.get('', iformat_default)
-        out = dic.get(c)
-        if out is not None:
-            return out.replace(SUBPOINT, c)
+    bounds = _range_bounds(r_start, r_end)
+    pre_out_default = dic.get('', iformat_default)
+    # None replacements are kept, to use the default output
+    subs = {
+        k: v.replace(SUBPOINT, k)
+            if isinstance(k, str) and isinstance(v, str) else v
+        for k, v in dic.items()
+    }
+    subs_get = subs.get
+    default_subst = isinstance(pre_out_default, str)\
+        and (SUBPOINT in pre_out_default)
+    if default_subst:
+        default_split = tuple(pre_out_default.split(SUBPOINT))
+    if bounds is None:
+        lo, hi = (0, 0x10FFFF)
+    else:
+        lo, hi = bounds
+    if not multicodepoint:
+        if bounds is None:
+            def fn_dict(c):
+                out = subs_get(c)
+                if out is not None:
+                    return out
+                elif default_subst:
+                    return c.join(default_split)
+                else:
+                    return pre_out_default
         else:
-            return pre_out_default.replace(SUBPOINT, c)
-
+            def fn_dict(c):
+                if not (lo <= ord(c) <= hi):
+                    return c
+                out = subs_get(c)
+                if out is not None:
+                    return out
+                elif default_subst:
+                    return c.join(default_split)
+                else:
+                    return pre_out_default
+    elif bounds is None:
+        def fn_dict(c):
+            if len(c) > 1:
+                fmt = 'multi-char or multi-codepoint char {} not supported'
+                msg = fmt.format(c)
+                warn(msg, RuntimeWarning)
+            out = subs_get(c)
+            if out is not None:
+                return out
+            elif default_subst:
+                return c.join(default_split)
+            else:
+                return pre_out_default
+    else:
+        def fn_dict(c):
+            if len(c) > 1:
+                fmt = 'multi-char or multi-codepoint char {} not supported'
+                msg = fmt.format(c)
+                warn(msg, RuntimeWarning)
+            n = ord(c[0])
+            if not (lo <= n <= hi):
+                return c
+            out = subs_get(c)
+            if out is not None:
+                return out
+            elif default_subst:
+                return c.join(default_split)
+            else:
+                return pre_out_default
+
+    if pre_out_default == iformat_default:
+        # only characters with keys in dic are affected
+        fn_dict.domain = [
+            ord(k) for k in dic.keys()
+            if isinstance(k, str) and len(k) == 1 and (lo <= ord(k) <= hi)
+        ]
+    elif bounds is not None:
+        fn_dict.domain = range(lo, hi+1)
     return (fn_dict, SCOPE_CHAR,)
 
 def sfunc_from_re(re_str, repl):
@@ -174,16 +279,88 @@ def sfunc_from_re(re_str, repl):
     support for PCRE can vary widely between platforms.
     """
 
+    wrex_f = compile_re(re_str)
+    # refer to the whole match with \g<0> wherever the SUBPOINT appears
+    repl_tpl = repl.replace('\\', '\\\\').replace(SUBPOINT, r'\g<0>')
     def fn_re(s):
-        rs = repl
-        if isinstance(s, str) is False:
-            raise TypeError('this function is only for strings')
-        wrex_f = re.compile(re_str)
-        finish_rs = lambda m : rs.replace(SUBPOINT, m.group(0))
-        return wrex_f.sub(finish_rs, s)
+        return wrex_f.sub(repl_tpl, s)
 
     return (fn_re, SCOPE_STR,)
 
+def _run_char_fns(fns, c):
+    # Pass a character through a run of character-scope functions in
+    # order; deleted characters are not passed on to later functions
+    for fn in fns:
+        c = fn(c)
+        if not c:
+            break
+    return c
+
+def _fuse_char_fns(fns):
+    """
+    Fuse a run of character-scope functions into a single dict for use
+    with str.translate(). Returns None if any function in the run does
+    not declare the code points it affects in its domain attribute, if
+    any function fails on a code point in the domains, or if the table
+    would be larger than FUSE_LIMIT.
+
+    The table is the composition of all functions in the run: every
+    code point in the union of their domains is passed through the
+    whole run in order, so that a function may replace the output of
+    an earlier one. Only code points that are changed are kept.
+
+    """
+    cps = set()
+    for fn in fns:
+        domain = getattr(fn, 'domain', None)
+        if domain is None:
+            return None
+        cps.update(domain)
+        if len(cps) > FUSE_LIMIT:
+            return None
+    out = {}
+    try:
+        for n in cps:
+            c = chr(n)
+            tmp_c = _run_char_fns(fns, c)
+            if tmp_c != c:
+                out[n] = tmp_c
+    except Exception:
+        # leave functions that fail on some code points to run per-char,
+        # so that they only fail on characters that are translated
+        return None
+    # map unaffected ASCII code points to themselves, like the main
+    # module's translate_distinct() does for all characters
+    for n in range(0x80):
+        if n not in out:
+            out[n] = chr(n)
+    return out
+
+class _CharRunTable(dict):
+    """
+    A str.translate() table for a run of character-scope functions that
+    could not be fused by _fuse_char_fns(). Code points are passed
+    through the run on their first lookup, and the results are stored
+    in the table, so that later lookups of the same code point do not
+    run any Python code.
+
+    """
+    def __init__(self, fns):
+        super().__init__()
+        self._fns = fns
+
+    def __missing__(self, n):
+        try:
+            out = _run_char_fns(self._fns, chr(n))
+        except LookupError as e:
+            # str.translate() takes LookupErrors from tables to mean that
+            # the character is to be copied unchanged
+            fmt = 'char-scope function failed on {}'
+            msg = fmt.format(repr(chr(n)))
+            raise RuntimeError(msg) from e
+        self[n] = out
+        return out
+
 def sfunc_from_list(sf_list):
     """
     Create a Multi-Substitution Function which applies one or more
@@ -210,46 +387,52 @@ def sfunc_from_list(sf_list):
     for information on the syntax and format of sf_list.
     """
 
-    subs = sf_list
+    # for performance reasons, plan the execution of the functions
+    # once: group successive char-scope functions into runs to be
+    # performed on the same pass, and replace every run with a single
+    # str.translate() table where possible
+    plan = []
+    run = []
+    def flush_run():
+        fns = tuple(run)
+        table = _fuse_char_fns(fns)
+        if table is None:
+            # runs that cannot be fused get a table that is filled in
+            # as characters are encountered
+            table = _CharRunTable(fns)
+        plan.append((_SCOPE_TRANS, table,))
+        run.clear()
+
+    for i, sb in enumerate(sf_list):
+        sb_scope = sb[1]
+        if sb_scope == SCOPE_CHAR:
+            run.append(sb[0])
+        elif sb_scope == SCOPE_STR:
+            if len(run) > 0:
+                flush_run()
+            plan.append((SCOPE_STR, sb[0],))
+        else:
+            fmt = '{}: function with invalid scope not included'
+            msg = fmt.format(i)
+            warn(msg, RuntimeWarning)
+    if len(run) > 0:
+        flush_run()
+    plan = tuple(plan)
+    if len(plan) == 1 and plan[0][0] == _SCOPE_TRANS:
+        # a single run needs nothing more than a str.translate()
+        table = plan[0][1]
+        def fn_trans(s):
+            return s.translate(table)
+        return (fn_trans, SCOPE_STR,)
+
+    scope_trans = _SCOPE_TRANS
     def fn_multi(s):
-        nonlocal subs
-        i = 0
-        i_cs_start = 0
-        i_cs_end = 0
         out = s
-        def do_fns_char():
-            # run all collected character-scope functions on input
-            nonlocal out
-            tmp_s = ''
-            for c in out:
-                tmp_c = c
-                for i in range(i_cs_start, i_cs_end+1):
-                    fn_il = subs[i][0]
-                    tmp_c = fn_il(tmp_c)
-                tmp_s = ''.join((tmp_s, tmp_c,))
-            out = tmp_s
-
-        sb_scope_prev = None
-        for sb in subs:
-            sb_scope = sb[1]
-            fn_ol = sb[0]
-            if (sb_scope == SCOPE_CHAR):
-                # for performance reasons, identify multiple successive
-                # char-scope functions, and run them on the same pass
-                if (sb_scope != sb_scope_prev):
-                    i_cs_start = i
-                i_cs_end = i
-            elif sb_scope == SCOPE_STR:
-                #i_cs_end = i
-                do_fns_char()
-                out = fn_ol(out)
+        for scope, op in plan:
+            if scope is scope_trans:
+                out = out.translate(op)
             else:
-                fmt = '{}: function with invalid scope not included'
-                msg = fmt.format(i)
-                warn(msg, RuntimeWarning)
-            i += 1
-            sb_scope_prev = sb_scope
-        do_fns_char()
+                out = op(out)
         return out
 
     return (fn_multi, SCOPE_STR,)
@@ -285,3 +468,17 @@ def sfunc_from_list(sf_list):
 # Functions are applied in the same order as they appear in the list.
 #
 
+# Character-scope functions may declare the code points they affect in
+# a domain attribute (an iterable of int code points); the function must
+# return any character outside of its domain unchanged. Successive
+# functions which all declare a domain are fused into a single
+# str.translate() table by sfunc_from_list().
+#
+# Character-scope functions used with sfunc_from_list() must be pure:
+# the same character must always get the same replacement. Each
+# character is passed through a run of functions at most once for the
+# life of the Multi-Substitution function, whether or not the run is
+# fused, and the result is reused on every later call. Functions with
+# varying output, such as random per-character decorations, must be
+# made string-scope functions instead.
+#
@@ -50,3 +50,66 @@ class EqTests(TestCase):
         self.assertNotEqual(cpoff_a, cpoff_b)
         self.assertNotEqual(cpoff_b, cpoff_c)
 
+
+class TranslateDictTests(TestCase):
+    """
+    Tests to verify correctness of str.translate()-ready dicts
+
+    """
+    def test_as_translate_dict(self):
+        args = (65, 90, 119743)
+        cpoff = CodePointOffsetLookup(*args)
+        s = 'ABYZ abyz'
+
+        self.assertEqual(len(cpoff.as_translate_dict()), 26)
+        out = s.translate(cpoff.as_translate_dict())
+        self.assertEqual(out, s.translate(cpoff))
+        self.assertIs(cpoff.as_translate_dict(), cpoff.as_translate_dict())
+
+    def test_as_translate_dict_oor(self):
+        """
+        Leave out code points offset past U+10FFFF
+        """
+        cpoff = CodePointOffsetLookup(0x10FFF0, 0x10FFFF, 8)
+        out = cpoff.as_translate_dict()
+
+        self.assertEqual(len(out), 8)
+        self.assertNotIn(0x10FFF8, out)
+
+    def test_getitem_oor(self):
+        """
+        Suppress lookups offset past U+10FFFF
+        """
+        cpoff = CodePointOffsetLookup(0x10FFF0, 0x10FFFF, 8)
+
+        self.assertEqual(cpoff[0x10FFF7], '\U0010ffff')
+        with self.assertRaises(LookupError):
+            cpoff[0x10FFF8]
+        with self.assertRaises(LookupError):
+            cpoff[0x10FFEF]
+
+    def test_contains(self):
+        cpoff = CodePointOffsetLookup(65, 90, 119743)
+
+        self.assertIn(65, cpoff)
+        self.assertIn(90, cpoff)
+        self.assertNotIn(64, cpoff)
+        self.assertNotIn(91, cpoff)
+        self.assertNotIn('A', cpoff)
+
+        cpoff_oor = CodePointOffsetLookup(0x10FFF0, 0x10FFFF, 8)
+
+        self.assertIn(0x10FFF7, cpoff_oor)
+        self.assertNotIn(0x10FFF8, cpoff_oor)
+
+    def test_keys(self):
+        """
+        Convert CPOLs with dict(), leaving out offsets past U+10FFFF
+        """
+        cpoff = CodePointOffsetLookup(0x10FFF0, 0x10FFFF, 8)
+
+        self.assertEqual(cpoff.keys(), range(0x10FFF0, 0x10FFF8))
+        self.assertEqual(list(cpoff), list(cpoff.keys()))
+        self.assertEqual(dict(cpoff), cpoff.dict())
+        self.assertEqual(len(cpoff), 8)
+        self.assertEqual(dict(cpoff.items()), cpoff.dict())
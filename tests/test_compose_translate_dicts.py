@@ -0,0 +1,57 @@
+"""
+UILAAT Translate Dict Composition Helper Function Tests
+
+"""
+# Copyright © 2020 Moses Chong
+#
+# This file is part of the UILAAT: The Unicode Interlingual Aesthetic
+# Appropriation Toolkit
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+from unittest import TestCase
+
+from uilaat import compose_translate_dicts
+
+class ComposeTranslateDictsTests(TestCase):
+    """
+    Tests for compose_translate_dicts() in the main module
+    """
+
+    def test_compose(self):
+        """
+        Translate in one pass as if translating with each dict in turn
+        """
+        d1 = {ord('a'): 'bc', ord('x'): None, ord('y'): ord('z')}
+        d2 = {ord('b'): '\u24d1', ord('z'): '\u24e9', ord('d'): 'D'}
+        d3 = {ord('\u24d1'): None, 'c': 'ignored'}
+        s = 'abcdxyz'
+        dicts = (d1, d2, d3)
+
+        out = s.translate(compose_translate_dicts(dicts))
+        out_expected = s.translate(d1).translate(d2).translate(d3)
+        self.assertEqual(out, out_expected)
+
+    def test_compose_unchanged(self):
+        """
+        Leave input dicts unchanged
+        """
+        d1 = {ord('a'): 'b'}
+        d2 = {ord('b'): 'c'}
+        compose_translate_dicts((d1, d2))
+
+        self.assertEqual(d1, {ord('a'): 'b'})
+        self.assertEqual(d2, {ord('b'): 'c'})
@@ -8,7 +8,7 @@ Repository (JSONRepo) class
 import hashlib
 import re
 from datetime import datetime
-from os import path
+from os import path, stat, utime
 from unittest import TestCase
 from json import JSONEncoder
 
@@ -293,6 +293,63 @@ class LoadDbTests(TestCase):
                 self.assertEqual(trans, trans_expected)
         self.assertEqual(len(jr._tmp), len(dbs_keys))
 
+    def test_load_lone_surrogate(self):
+        """
+        Load database with lone surrogate escapes
+
+        """
+        name = 'test_load_lone_surrogate'
+        db = {
+            'meta': {
+                'reverse-trans': False,
+                'version': VERSION,
+                'desc': {
+                    'en-au': 'Lone surrogate loading test',
+                },
+            },
+            'trans': {'1': ['\ud835']},
+        }
+        write_json_file(name, db)
+        jr = JSONRepo(REPO_DIR)
+        jr.load_db(name)
+
+        # assertions
+        self.assertEqual(jr.current_db_name, name)
+        self.assertEqual(jr.get_trans()[0][ord('1')], '\ud835')
+
+    def test_load_cache(self):
+        """
+        Decode databases again only if their files have changed
+
+        """
+        name = 'test_load_cache'
+        db = {
+            'meta': {
+                'reverse-trans': False,
+                'version': VERSION,
+                'desc': {
+                    'en-au': 'Database caching test',
+                },
+            },
+            'trans': {'1': FANCY_ONE_a},
+        }
+        write_json_file(name, db)
+        jr = JSONRepo(REPO_DIR)
+        jr.load_db(name)
+        db_a = jr._tmp[0]
+        jr.load_db(name)
+        db_b = jr._tmp[0]
+        fpath = path.join(REPO_DIR, name+SUFFIX_JSON)
+        st = stat(fpath)
+        utime(fpath, ns=(st.st_atime_ns, st.st_mtime_ns+1000))
+        jr.load_db(name)
+        db_c = jr._tmp[0]
+
+        # assertions
+        self.assertIs(db_b, db_a)
+        self.assertIsNot(db_c, db_a)
+        self.assertEqual(db_c, db_a)
+
 
 class GetTransTests(TestCase):
     """
@@ -367,6 +424,68 @@ class GetTransTests(TestCase):
         trans = jr.get_trans(one_dict=True)
         self.assertEqual(trans, trans_expected)
 
+    def test_get_translate_table(self):
+        """
+        Get combined str.translate() table and regexes
+
+        """
+        name = 'test_get_translate_table'
+        db = {
+            'meta': {
+                'reverse-trans': False,
+                'version': VERSION,
+                'desc': {
+                    'en-au': 'Single-database translate table test',
+                },
+            },
+            'trans': {
+                'x': FANCY_Xm,
+                JSONRepo.CODE_REGEX+' '+'cat': [r'cat','\U0001f63b'],
+                JSONRepo.CODE_OFFSET+' '+'numerals': [48,50,1584],
+            }
+        }
+        write_json_file(name, db)
+        jr = JSONRepo(REPO_DIR)
+        jr.load_db(name)
+        table_expected = {ord('x'): FANCY_Xm, 48: chr(1632), 49: chr(1633),
+            50: chr(1634),}
+        regexes_expected = [[re.compile(r'cat'), '\U0001f63b'],]
+
+        # assertions
+        table, regexes = jr.get_translate_table()
+        self.assertEqual(table, table_expected)
+        self.assertEqual(regexes, regexes_expected)
+        self.assertIs(jr.get_translate_table()[0], table)
+
+    def test_get_trans_cache(self):
+        """
+        Share translation lists between calls until a database is loaded
+
+        """
+        name = 'test_get_trans_cache'
+        db = {
+            'meta': {
+                'reverse-trans': False,
+                'version': VERSION,
+                'desc': {
+                    'en-au': 'Translation list caching test',
+                },
+            },
+            'trans': {'1': [FANCY_ONE_a, FANCY_ONE_b, FANCY_ONE_c]},
+        }
+        write_json_file(name, db)
+        jr = JSONRepo(REPO_DIR)
+        jr.load_db(name)
+
+        # assertions
+        trans_a = jr.get_trans()
+        self.assertIs(jr.get_trans(n=0), trans_a)
+        self.assertIsNot(jr.get_trans(n=1), trans_a)
+        self.assertIsNot(jr.get_trans(one_dict=True), trans_a)
+        jr.load_db(name)
+        self.assertIsNot(jr.get_trans(), trans_a)
+        self.assertEqual(jr.get_trans(), trans_a)
+
     def test_get_trans_db_switch(self):
         """
         Switch between translations
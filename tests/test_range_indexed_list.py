@@ -282,6 +282,31 @@ class GetitemTests(TestCase):
             with self.subTest(k=k):
                 self.assertEqual(ril[k], vals[i//2])
 
+class DictTests(TestCase):
+    """
+    Tests to verify conversion to plain dicts
+
+    """
+    def test_dict(self):
+        ks = (5,7,10,11)
+        vals = ('c1','c2')
+        ril = RangeIndexedList(ks, vals)
+        out_expected = {5:'c1', 6:'c1', 7:'c1', 10:'c2', 11:'c2'}
+
+        self.assertEqual(ril.dict(), out_expected)
+
+    def test_dict_copykey(self):
+        """
+        Insert copies of keys when copy_key is enabled
+
+        """
+        ks = (97,98,120,120)
+        vals = ('\ufffc\u20e0',)
+        ril = RangeIndexedList(ks, vals, copy_key=True)
+        out_expected = {97:'a\u20e0', 98:'b\u20e0', 120:'x\u20e0'}
+
+        self.assertEqual(ril.dict(), out_expected)
+
 class InsertTests(TestCase):
     """
     Tests to verify correctness of range insertions
@@ -429,4 +454,91 @@ class InsertTests(TestCase):
         self.assertEqual(ril._bounds, ks)
         self.assertEqual(ril._values, vals)
 
+    def test_insert_multi(self):
+        """
+        Insert multiple unsorted new ranges in one call
+
+        """
+        ks = (5,10,30,35)
+        vals = [i for i in range(len(ks)//2)]
+        ril = RangeIndexedList(ks, vals)
+
+        new_ranges = (40,45,12,20,0,3)
+        ril.insert(new_ranges, (42,69,420))
+
+        rks_exp = [0,3,5,10,12,20,30,35,40,45]
+        self.assertEqual(ril._bounds, rks_exp)
+        rvals_exp = [420,0,69,1,42]
+        self.assertEqual(ril._values, rvals_exp)
+
+    def test_insert_multi_overlap(self):
+        """
+        Handle attempt to insert new ranges overlapping each other
+
+        """
+        ks = [5,10,30,35]
+        vals = [i for i in range(len(ks)//2)]
+        ril = RangeIndexedList(ks, vals)
+
+        with self.assertRaises(ValueError):
+            new_ranges = (40,50,45,60)
+            ril.insert(new_ranges)
+        self.assertEqual(ril._bounds, ks)
+        self.assertEqual(ril._values, vals)
+
+class TranslateTests(TestCase):
+    """
+    Tests to verify correctness of whole-string translations
+
+    """
+    def test_translate(self):
+        """
+        Translate string with characters in and out of ranges
+
+        """
+        ks = (97,99,120,122)
+        vals = ('\ufffc\u20e0', '\ufffc\u20df')
+        ril = RangeIndexedList(ks, vals, copy_key=True)
+        s = 'abcdxyz\U0001f600'
+
+        self.assertEqual(ril.translate(s), s.translate(ril))
+
+    def test_translate_none(self):
+        """
+        Remove characters in ranges with None values
+
+        """
+        ks = (97,99)
+        vals = (None,)
+        ril = RangeIndexedList(ks, vals, copy_key=True)
+
+        self.assertEqual(ril.translate('abcd'), 'd')
+
+    def test_translate_dict_insert(self):
+        """
+        Share translate dicts between calls until ranges are inserted
+
+        """
+        ks = (97,99)
+        vals = ('\ufffc\u20e0',)
+        ril = RangeIndexedList(ks, vals, copy_key=True)
+        table = ril.as_translate_dict()
+
+        self.assertIs(ril.as_translate_dict(), table)
+        self.assertEqual(ril.translate('abcd'), 'a\u20e0b\u20e0c\u20e0d')
+        ril.insert((100,101), ('\ufffc\u20df',))
+        self.assertIsNot(ril.as_translate_dict(), table)
+        self.assertEqual(ril.translate('abcd'), 'a\u20e0b\u20e0c\u20e0d\u20df')
+
+    def test_translate_large(self):
+        """
+        Translate with RILs too large to convert to a dict
+
+        """
+        ks = (0x10000,0x10FFFF)
+        vals = ('\ufffc\u20e0',)
+        ril = RangeIndexedList(ks, vals, copy_key=True)
+        s = 'a\U0001f600'
 
+        self.assertEqual(ril.translate(s), s.translate(ril))
+        self.assertIsNone(ril._translate_dict)
@@ -0,0 +1,227 @@
+"""
+UILAAT Early Concept Prototype Function Tests
+
+"""
+# Copyright © 2020 Moses Chong
+#
+# This file is part of the UILAAT: The Unicode Interlingual Aesthetic
+# Appropriation Toolkit
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from unittest import TestCase
+from warnings import catch_warnings, simplefilter
+
+with catch_warnings():
+    simplefilter('ignore', DeprecationWarning)
+    from sfunc import (
+        SCOPE_CHAR, SCOPE_STR, _fuse_char_fns, sfunc_from_covar,
+        sfunc_from_dict, sfunc_from_list, sfunc_from_re
+    )
+
+# Test Resources
+def fn_upper_fail_z(c):
+    # char-scope function that fails on 'z' inside its declared domain
+    if c == 'z':
+        raise KeyError(c)
+    return c.upper() if 'a' <= c <= 'y' else c
+fn_upper_fail_z.domain = range(ord('a'), ord('z')+1)
+
+class SingleCodepointTests(TestCase):
+    """
+    Tests for char-scope functions created with multicodepoint=False,
+    which must agree with those created with multicodepoint=True on
+    single code point characters
+    """
+    chars = 'aAz09 !\u00e9\u4e00\U0001f600'
+
+    def assert_same_output(self, sfunc, *args):
+        fn_multi = sfunc(*args, multicodepoint=True)[0]
+        fn_single = sfunc(*args, multicodepoint=False)[0]
+        for c in self.chars:
+            self.assertEqual(fn_single(c), fn_multi(c))
+
+    def test_covar(self):
+        """
+        Compare Code Point Value Arithmetic functions without bounds
+        """
+        self.assert_same_output(sfunc_from_covar, None, None, 1)
+
+    def test_covar_bounded(self):
+        """
+        Compare Code Point Value Arithmetic functions with bounds
+        """
+        self.assert_same_output(sfunc_from_covar, 97, 122, 0x1d41a-97)
+
+    def test_dict(self):
+        """
+        Compare Dictionary Substitution functions without bounds
+        """
+        dic = {'a': '\u0251', 'A': '', '': '\ufffc\u20e0'}
+        self.assert_same_output(sfunc_from_dict, None, None, dic)
+
+    def test_dict_bounded(self):
+        """
+        Compare Dictionary Substitution functions with bounds
+        """
+        dic = {'a': '\u0251', 'z': '\ufffc\ufffc', '0': 'O'}
+        self.assert_same_output(sfunc_from_dict, 97, 122, dic)
+
+class SfuncFromDictTests(TestCase):
+    """
+    Tests for Dictionary Substitution functions from sfunc_from_dict()
+    """
+
+    def test_none(self):
+        """
+        Use the default output for characters replaced with None
+        """
+        fn_dict = sfunc_from_dict(None, None, {'a': None, '': '\ufffc!'})[0]
+
+        self.assertEqual(fn_dict('a'), 'a!')
+
+    def test_non_str_key(self):
+        """
+        Pass over keys that are not strs
+        """
+        dic = {65: 'x', 'b': 'y', '': '\ufffc!'}
+        fn_dict = sfunc_from_dict(None, None, dic)[0]
+
+        self.assertEqual(fn_dict('b'), 'y')
+        self.assertEqual(fn_dict('A'), 'A!')
+
+    def test_non_str_key_domain(self):
+        """
+        Leave keys that are not strs out of the declared domain
+        """
+        fn_dict = sfunc_from_dict(None, None, {65: 'x', 'b': 'y'})[0]
+
+        self.assertEqual(list(fn_dict.domain), [ord('b')])
+        self.assertEqual(fn_dict('b'), 'y')
+        self.assertEqual(fn_dict('A'), 'A')
+
+class SfuncFromReTests(TestCase):
+    """
+    Tests for Regular Expression functions from sfunc_from_re()
+    """
+
+    def test_subpoint(self):
+        """
+        Insert copies of matches wherever the SUBPOINT appears
+        """
+        fn_re = sfunc_from_re('b+', '<\ufffc|\ufffc>')[0]
+
+        self.assertEqual(fn_re('abbc'), 'a<bb|bb>c')
+
+    def test_backslash(self):
+        """
+        Copy backslashes in replacements literally
+        """
+        fn_re = sfunc_from_re('b', '\\1\\g<0>\\\ufffc')[0]
+
+        self.assertEqual(fn_re('abc'), 'a\\1\\g<0>\\bc')
+
+class SfuncFromListTests(TestCase):
+    """
+    Tests for Multi-Substitution functions from sfunc_from_list()
+    """
+
+    def test_fused(self):
+        """
+        Perform a run of char-scope functions with declared domains
+        """
+        fns = (
+            sfunc_from_dict(97, 122, {'a': 'b'}),
+            sfunc_from_covar(97, 122, 1),
+        )
+        fn_multi = sfunc_from_list(fns)[0]
+
+        self.assertIsNotNone(_fuse_char_fns(tuple(f[0] for f in fns)))
+        self.assertEqual(fn_multi('abz!'), 'cc{!')
+
+    def test_fused_delete(self):
+        """
+        Do not pass deleted characters to later char-scope functions
+        """
+        fns = (
+            sfunc_from_dict(97, 122, {'a': ''}),
+            sfunc_from_covar(97, 122, 1),
+        )
+        fn_multi = sfunc_from_list(fns)[0]
+
+        self.assertEqual(fn_multi('bcd'), 'cde')
+        self.assertEqual(fn_multi('ab'), 'c')
+
+    def test_unfused(self):
+        """
+        Perform a run of char-scope functions without declared domains
+        """
+        fns = (
+            sfunc_from_covar(None, None, 1),
+            sfunc_from_dict(None, None, {'c': 'C'}),
+        )
+        fn_multi = sfunc_from_list(fns)[0]
+
+        self.assertIsNone(_fuse_char_fns(tuple(f[0] for f in fns)))
+        self.assertEqual(fn_multi('abab'), 'bCbC')
+
+    def test_unfused_fail(self):
+        """
+        Perform runs that fail on some characters in declared domains
+        """
+        fn_multi = sfunc_from_list(((fn_upper_fail_z, SCOPE_CHAR,),))[0]
+
+        self.assertIsNone(_fuse_char_fns((fn_upper_fail_z,)))
+        self.assertEqual(fn_multi('ab!'), 'AB!')
+        with self.assertRaises(RuntimeError):
+            fn_multi('xyz')
+
+    def test_unfused_delete(self):
+        """
+        Do not pass deleted characters to later char-scope functions,
+        without declared domains
+        """
+        fns = (
+            sfunc_from_dict(97, 122, {'a': ''}),
+            sfunc_from_covar(None, None, 1),
+        )
+        fn_multi = sfunc_from_list(fns)[0]
+
+        self.assertEqual(fn_multi('ab'), 'c')
+
+    def test_mixed(self):
+        """
+        Perform char-scope and str-scope functions in order
+        """
+        fns = (
+            sfunc_from_covar(97, 122, 1),
+            sfunc_from_re('c+', '<\ufffc>'),
+            sfunc_from_dict(None, None, {'<': '[', '>': ']'}),
+        )
+        fn_multi = sfunc_from_list(fns)[0]
+
+        self.assertEqual(fn_multi('abbx'), 'b[cc]y')
+
+    def test_char_once(self):
+        """
+        Perform char-scope functions followed by str-scope functions once
+        """
+        fns = (
+            sfunc_from_covar(None, None, 1),
+            (str.upper, SCOPE_STR,),
+        )
+        fn_multi = sfunc_from_list(fns)[0]
+
+        self.assertEqual(fn_multi('a'), 'B')
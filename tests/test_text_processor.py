@@ -0,0 +1,76 @@
+"""
+UILAAT TextProcessor class Tests
+
+"""
+# Copyright © 2020 Moses Chong
+#
+# This file is part of the UILAAT: The Unicode Interlingual Aesthetic
+# Appropriation Toolkit
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from unittest import TestCase
+from uilaat import TextProcessor
+
+# Test Resources
+dict_a = {ord('a'): 'bc', ord('x'): None}
+dict_b = {ord('b'): '\u24d1', ord('c'): 'a'}
+dict_c = {ord('\u24d1'): 'B', ord('a'): 'A'}
+
+class TranslateTests(TestCase):
+    """
+    Tests for translate() with lookups that use plain dicts
+    """
+
+    def setUp(self):
+        self.tp = TextProcessor({})
+        self.tp.trans_dicts = {
+            'test:a.0': [dict_a,],
+            'test:b.0': [dict_b,],
+            'test:c.0': [dict_c,],
+        }
+        self.tp.meta = {k: {} for k in self.tp.trans_dicts.keys()}
+
+    def test_translate_plain_dicts(self):
+        """
+        Translate with plain dicts in turn
+        """
+        s = 'abcxyz'
+        out = self.tp.translate(s, order=[0, 1, 2])
+        out_rev = self.tp.translate(s, order=[2, 1, 0])
+
+        out_expected = s.translate(dict_a).translate(dict_b)
+        out_expected = out_expected.translate(dict_c)
+        out_rev_expected = s.translate(dict_c).translate(dict_b)
+        out_rev_expected = out_rev_expected.translate(dict_a)
+
+        self.assertEqual(out, out_expected)
+        self.assertEqual(out_rev, out_rev_expected)
+
+    def test_translate_composed_cache(self):
+        """
+        Reuse composed dicts for the same sequence of dicts
+        """
+        self.tp.translate('abc', order=[0, 1])
+        composed = tuple(self.tp._composed.values())
+        out = self.tp.translate('cab', order=[0, 1])
+
+        self.assertEqual(len(composed), 1)
+        self.assertIs(tuple(self.tp._composed.values())[0][1], composed[0][1])
+        self.assertEqual(out, 'cab'.translate(dict_a).translate(dict_b))
+        self.tp.translate('abc', order=[1, 0])
+        self.assertEqual(len(self.tp._composed), 2)
+        self.tp.clear_trans()
+        self.assertEqual(len(self.tp._composed), 0)
@@ -0,0 +1,69 @@
+"""
+UILAAT Distinct Character Translation Helper Function Tests
+
+"""
+# Copyright © 2020 Moses Chong
+#
+# This file is part of the UILAAT: The Unicode Interlingual Aesthetic
+# Appropriation Toolkit
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+
+
+from unittest import TestCase
+
+from uilaat import SUBPOINT, TranslationDict, translate_distinct
+
+# Test Resources
+FANCY_A = '\u1555'
+test_str = 'abcabc \uffff'
+
+class TranslateDistinctTests(TestCase):
+    """
+    Tests for translate_distinct() in the main module, with
+    TranslationDicts of every kind of default output
+    """
+
+    def test_default_copy(self):
+        """
+        Copy characters not found in the dict
+        """
+        tdict = TranslationDict.from_dict({'a': FANCY_A, '': SUBPOINT})
+        out = translate_distinct(test_str, tdict)
+
+        self.assertEqual(out, test_str.translate(tdict))
+        self.assertEqual(out, test_str.replace('a', FANCY_A))
+
+    def test_default_split(self):
+        """
+        Insert characters not found in the dict into the default output
+        """
+        default = '<' + SUBPOINT + '>'
+        tdict = TranslationDict.from_dict({'a': FANCY_A, '': default})
+        out = translate_distinct(test_str, tdict)
+
+        self.assertEqual(out, test_str.translate(tdict))
+        out_expected = FANCY_A + '<b><c>' + FANCY_A + '<b><c>< ><\uffff>'
+        self.assertEqual(out, out_expected)
+
+    def test_default_substitute(self):
+        """
+        Replace characters not found in the dict with the default output
+        """
+        tdict = TranslationDict.from_dict({'a': FANCY_A, '': '?'})
+        out = translate_distinct(test_str, tdict)
+
+        self.assertEqual(out, test_str.translate(tdict))
+        self.assertEqual(out, FANCY_A + '??' + FANCY_A + '????')
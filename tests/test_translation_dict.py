@@ -103,6 +103,26 @@ class GetitemTests(TestCase):
         self.assertEqual(tdict_d.out_default, out_nf)
         self.assertEqual(out_nf, test_newdef)
 
+    def test_setitem_int_oor(self):
+        """
+        Store outputs of int keys that are not valid code points
+        """
+        tdict_d = self.clsc.from_dict({-1: FANCY_A, 0x110000: FANCY_Bm})
+        tdict_d[-2] = FANCY_A
+
+        self.assertEqual(tdict_d[-1], FANCY_A)
+        self.assertEqual(tdict_d[0x110000], FANCY_Bm)
+        self.assertEqual(tdict_d[-2], FANCY_A)
+
+    def test_getitem_default_key(self):
+        """
+        Return the default output as it was set from the '' key
+        """
+        tdict_d = self.clsc.from_dict(dict_with_default)
+
+        self.assertEqual(tdict_d[''], DEFAULT_OUT)
+        self.assertEqual(tdict_d.get_dict()[''], DEFAULT_OUT)
+
     def test_setitem_multi_codepoint(self):
         """
         Handle insertion of multi-code point string to dictionary
@@ -116,6 +136,18 @@ class GetitemTests(TestCase):
 
         self.assertEqual(out_lu, test_newval)
 
+    def test_setitem_str_subclass(self):
+        """
+        Handle outputs of str subclasses
+        """
+        class SubStr(str):
+            pass
+        tdict_d = self.clsc.from_dict({'a': SubStr(FANCY_A)})
+        tdict_d['b'] = SubStr(FANCY_Bm)
+
+        self.assertEqual(tdict_d[ord('a')], FANCY_A)
+        self.assertEqual(tdict_d[ord('b')], FANCY_Bm)
+
     def test_getdict(self):
         """
         Conversion to plain dict; retain str.translate()-ready format
@@ -134,3 +166,86 @@ class GetitemTests(TestCase):
 
         self.assertEquals(tdict_d, out_expected)
 
+
+    def test_getitem_copy_key(self):
+        """
+        Insert copies of keys into outputs of found keys
+        """
+        tdict_c = self.clsc.from_dict({'a': SUBPOINT + '\u20e0'})
+        out = tdict_c[ord('a')]
+
+        self.assertEqual(out, 'a\u20e0')
+
+    def test_translate(self):
+        """
+        Use with str.translate(), with default output
+        """
+        tdict_d = self.clsc.from_dict(dict_with_default)
+        out = 'abc'.translate(tdict_d)
+        out_expected = ''.join(
+            (FANCY_A, FANCY_Bm, DEFAULT_OUT.replace(SUBPOINT, 'c'))
+        )
+
+        self.assertEqual(out, out_expected)
+
+    def test_to_maketrans(self):
+        """
+        Convert to plain dict for str.translate(), without default output
+        """
+        tdict_d = self.clsc.from_dict(dict_with_default)
+        out = tdict_d.to_maketrans()
+
+        self.assertIs(type(out), dict)
+        self.assertEqual(out, {ord('a'): FANCY_A, ord('b'): FANCY_Bm})
+        self.assertIs(tdict_d.to_maketrans(), out)
+        tdict_d['c'] = SUBPOINT
+        self.assertEqual(tdict_d.to_maketrans()[ord('c')], 'c')
+
+    def test_update(self):
+        """
+        Convert items added with update() like those set with []
+        """
+        tdict_d = self.clsc.from_dict(dict_plain)
+        tdict_d.update({ord('c'): SUBPOINT + '!', 'd': FANCY_A})
+
+        self.assertEqual(tdict_d[ord('c')], 'c!')
+        self.assertEqual(tdict_d[ord('d')], FANCY_A)
+        self.assertEqual('cd'.translate(tdict_d), 'c!' + FANCY_A)
+
+    def test_setdefault(self):
+        """
+        Convert items added with setdefault() like those set with []
+        """
+        tdict_d = self.clsc.from_dict(dict_plain)
+        out_new = tdict_d.setdefault(ord('c'), SUBPOINT + '!')
+        out_found = tdict_d.setdefault('a', 'unused')
+
+        self.assertEqual(out_new, 'c!')
+        self.assertEqual(out_found, FANCY_A)
+        self.assertEqual(tdict_d[ord('c')], 'c!')
+
+    def test_ior(self):
+        """
+        Convert items added with |= like those set with []
+        """
+        tdict_d = self.clsc.from_dict(dict_plain)
+        tdict_d |= {ord('c'): SUBPOINT + '!'}
+
+        self.assertIsInstance(tdict_d, self.clsc)
+        self.assertEqual(tdict_d[ord('c')], 'c!')
+
+    def test_to_maketrans_removed(self):
+        """
+        Leave out items removed after converting to plain dict
+        """
+        tdict_d = self.clsc.from_dict(dict_with_default)
+        tdict_d.to_maketrans()
+        tdict_d.pop(ord('a'))
+        self.assertEqual(tdict_d.to_maketrans(), {ord('b'): FANCY_Bm})
+        tdict_d.popitem()
+        tdict_d.popitem()
+        self.assertEqual(tdict_d.to_maketrans(), {})
+        tdict_d.update({'c': FANCY_A})
+        self.assertEqual(tdict_d.to_maketrans(), {ord('c'): FANCY_A})
+        tdict_d.clear()
+        self.assertEqual(tdict_d.to_maketrans(), {})
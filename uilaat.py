@@ -27,16 +27,26 @@ A mini-library for working with decorative Unicode text
 
 import re
 from bisect import bisect_right
-from functools import reduce
-from json import JSONDecoder
-from os import listdir, path
+from functools import lru_cache, reduce
+from heapq import merge
+from json import loads as json_loads
+from operator import itemgetter
+from os import listdir, path, stat
+from sys import intern
 from warnings import warn
 
+try:
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_loads = None
+
 KEY_DB_NAME = '_db_name'
 SUBPOINT = '\ufffc' # Unicode Object Replacement
 SUFFIX_JSON = '.json'
 VERSION = '0.6'
 is_odd = lambda x : x%2 != 0
+compile_re = lru_cache(maxsize=1024)(re.compile)
+    # re.compile() with compiled patterns shared by pattern string
 
 # Helper functions
 # See docs/json-repo-surrogates.rst for an explanation on how these
@@ -66,6 +76,78 @@ def surr(c):
     else:
         raise ValueError('surrogates are for code points 0x10000 to 0x10FFFF')
 
+def load_json(s):
+    """
+    Decode a JSON document in a str or UTF-8 encoded bytes, using
+    orjson if it is installed.
+
+    orjson refuses some documents that the json module accepts, such as
+    those with lone surrogate escapes (e.g. "\\ud83d"); these documents
+    are decoded with the json module instead.
+
+    """
+    if orjson_loads is not None:
+        try:
+            return orjson_loads(s)
+        except ValueError:
+            pass # fall back to the json module below
+    # PROTIP: json.loads() reuses the json module's shared JSONDecoder
+    # when no decoding options are specified
+    return json_loads(s)
+
+def translate_distinct(s, table):
+    """
+    Return s.translate(table), but with every distinct character in s
+    looked up in table only once.
+
+    Use this with tables that run Python code on lookups, such as
+    RangeIndexedLists or TranslationDicts with default outputs, to
+    avoid repeating lookups for characters that occur more than once.
+    The translation itself is performed by str.translate() with a plain
+    dict of the lookup results.
+
+    """
+    # PROTIP: characters not found in table are mapped to themselves in
+    # lut, as str.translate() is much slower on keys missing from a dict
+    lut = {}
+    for c in set(s):
+        n = ord(c)
+        try:
+            lut[n] = table[n]
+        except LookupError:
+            lut[n] = c
+    return s.translate(lut)
+
+def compose_translate_dicts(tables):
+    """
+    Return a single dict for use with str.translate() that performs
+    the translations of all plain dicts in tables, in order, in one
+    pass. Where:
+
+    t = compose_translate_dicts((d1, d2))
+
+    s.translate(t) == s.translate(d1).translate(d2)
+
+    Only lookups on int keys are carried over, like in str.translate().
+    Lookup objects that run Python code for keys they do not contain,
+    like TranslationDicts with default outputs, cannot be composed.
+
+    """
+    out = {}
+    for t in tables:
+        # translate the outputs so far...
+        for k, v in out.items():
+            if v is None:
+                continue
+            elif isinstance(v, int):
+                v = chr(v)
+            out[k] = v.translate(t)
+        # ...then add lookups for code points that got through unchanged
+        for k, v in t.items():
+            if isinstance(k, int) and (k not in out):
+                out[k] = v
+    return out
+
 def dump_code_page(plane, page):
     """
     Naively dumps a code page of Unicode code points as a string, without
@@ -99,20 +181,15 @@ def dump_code_page(plane, page):
         return None
     if plane > 10 or page > 0xFF:
         return None
-    out = ''
     if plane == 0 and page == 0:
         # Avoid dumping code points identical to ASCII control codes
         # to avoid messing up terminal emulators
-        for i in range(32, 127):
-            out = ''.join((out, chr(i),))
-        for i in range(174, 256):
-            out = ''.join((out, chr(i),))
+        cps = (*range(32, 127), *range(174, 256))
     else:
         start = (plane << 16) +  (page << 8)
         end = start | 0xFF
-        for i in range(start, end+1):
-            out = ''.join((out, chr(i),))
-    return out
+        cps = range(start, end+1)
+    return ''.join(map(chr, cps))
 
 def dump_page(plane, page):
     # support use of deprecated function
@@ -148,18 +225,58 @@ class CodePointOffsetLookup:
     for help on using it.
 
     """
+    def as_translate_dict(self):
+        """
+        Return a plain dict for use with str.translate(), mapping every
+        code point within the CPOL's lookup range to its offset code
+        point value as an int.
+
+        Unlike the CPOL itself, str.translate() does not need to call
+        any Python code to perform lookups on this dict, so prefer
+        s.translate(cpol.as_translate_dict()) over s.translate(cpol).
+        Code points offset past U+10FFFF are left out.
+
+        The dict is built on the first call, and the same dict is
+        returned on every call after; please copy it before making
+        changes.
+
+        """
+        if self._translate_dict is None:
+            off = self._offset
+            self._translate_dict = {i: i+off for i in self.keys()}
+        return self._translate_dict
+
     def dict(self):
         """
         Return a Python dict equivalent of the CodePointOffsetLookup
 
         Lookups will be expanded into multiple keys and values, one for
-        each key within the CPOL's lookup range.
+        each key within the CPOL's lookup range. Code points offset past
+        U+10FFFF are left out.
 
         """
-        out = {}
-        for i in range(self._start, self._end+1):
-            out[i] = self.__getitem__(i)
-        return out
+        off = self._offset
+        return {i: chr(i+off) for i in self.keys()}
+
+    def keys(self):
+        """
+        Return a range of all code points that the CPOL can look up,
+        leaving out code points offset past U+10FFFF.
+
+        Together with __getitem__(), this allows CPOLs to be used with
+        dict() and dict.update().
+
+        """
+        return range(self._start, self._lookup_end+1)
+
+    def items(self):
+        """
+        Return an iterator of (code point, output) tuples for all code
+        points that the CPOL can look up, see keys()
+
+        """
+        off = self._offset
+        return ((i, chr(i+off)) for i in self.keys())
 
     def __init__(self, start, end, offset):
         """
@@ -172,14 +289,14 @@ class CodePointOffsetLookup:
 
         """
         # validate start and end
-        if (isinstance(start, int) is False) or (isinstance(end, int) is False):
+        if not (isinstance(start, int) and isinstance(end, int)):
             raise ValueError('both start and end must be int')
         elif start < 0 or end < 0:
             raise ValueError('start and end must be zero or positive')
         elif start > end:
             raise ValueError('start must come before end')
         # validate offset
-        if isinstance(offset, int) is False:
+        if not isinstance(offset, int):
             raise ValueError('offset must be int')
         elif start+offset < 0:
             raise ValueError('offset must not cause negative values to return')
@@ -187,6 +304,16 @@ class CodePointOffsetLookup:
         self._start = start
         self._end = end
         self._offset = offset
+        self._lookup_end = min(end, 0x10FFFF-offset)
+        self._translate_dict = None
+
+    def __contains__(self, key):
+        """
+        x in cpol is True when x is an int within the CPOL's lookup range
+
+        """
+        return isinstance(key, int)\
+            and (self._start <= key <= self._lookup_end)
 
     def __eq__(self, other):
         """
@@ -199,6 +326,21 @@ class CodePointOffsetLookup:
         return (self._start == other._start) and (self._end == other._end)\
             and (self._offset == other._offset)
 
+    def __iter__(self):
+        """
+        Iterate over all code points that the CPOL can look up, see keys()
+
+        """
+        return iter(self.keys())
+
+    def __len__(self):
+        """
+        len(cpol) is the number of code points that the CPOL can look
+        up, see keys()
+
+        """
+        return len(self.keys())
+
     def __getitem__(self, key):
         """
         Using a CodePointOffsetLookup:
@@ -210,20 +352,13 @@ class CodePointOffsetLookup:
         LookupError is raised if x < a or x > b
 
         """
-        # validate key
-        if isinstance(key, int) is False:
-            raise ValueError('only int keys are supported')
-        elif key > self._end:
-            raise LookupError('requested translation out of range')
-        elif key < self._start:
-            raise LookupError('requested translation out of range')
-        out = key + self._offset
-        if out < 0:
-            raise ValueError('negative code point suppressed')
-        elif out > 0x10FFFF:
+        # __init__() works out the last key that stays within U+10FFFF
+        if self._start <= key <= self._lookup_end:
+            return chr(key + self._offset)
+        elif self._start <= key <= self._end:
             raise LookupError('out of range code point suppressed')
         else:
-            return chr(out)
+            raise LookupError('requested translation out of range')
 
 class RangeIndexedList:
     """
@@ -238,6 +373,8 @@ class RangeIndexedList:
 
     """
     DEFAULT_VALUE = True
+    TRANSLATE_DICT_LIMIT = 0x10000
+        # max keys covered by an RIL for translate() to use a plain dict
 
     def __init__(self, bounds, values=None, **kwargs):
         """
@@ -279,8 +416,10 @@ class RangeIndexedList:
         self._copy_key = kwargs.get('copy_key', False)
         self._default = kwargs.get('default', self.DEFAULT_VALUE)
         self._bounds = list(bounds)
+            # bisect runs slower on an array.array, which boxes items
         self._values = None
         self._validate = kwargs.get('validate', True)
+        self._translate_dict = None
 
         # TODO: Default value is deprecated, please use a list with a
         # single value instead.
@@ -305,7 +444,11 @@ class RangeIndexedList:
         """
         if not isinstance(other, type(self)):
             raise TypeError('can only compare with other range-indexed lists')
-        return self.__dict__ == other.__dict__
+        return (self._bounds == other._bounds)\
+            and (self._values == other._values)\
+            and (self._copy_key == other._copy_key)\
+            and (self._default == other._default)\
+            and (self._validate == other._validate)
 
     def __getitem__(self, key):
         """
@@ -325,21 +468,25 @@ class RangeIndexedList:
         See __init__ for more options.
 
         """
-        i, found = self._do_index(key)
-        out = None
-        if found is False:
+        # PROTIP: the search in _do_index() is repeated here to save a
+        # method call on every lookup. An odd insertion point means
+        # that the key is between the bounds of a range. Check for
+        # this first, so keys in ranges get through with a single test.
+        # An even insertion point is only in a range if the key is the
+        # end bound right before it.
+        bounds = self._bounds
+        i = bisect_right(bounds, key)
+        if not ((i & 1) or (i > 0 and bounds[i-1] == key)):
             if i == 0:
                 raise LookupError('key smaller than smallest known key')
-            elif i == len(self._bounds):
+            elif i == len(bounds):
                 raise LookupError('key larger than largest known key')
-            elif not is_odd(i):
+            else:
                 raise LookupError('key not in any range')
-        # PROTIP: if the key was not found, but an even index was
-        # suggested, then the key is considered inside a range.
         if len(self._values) == 1:
             out = self._values[0]
         else:
-            out = self._values[i//2]
+            out = self._values[(i-1)//2]
         if self._copy_key is False:
             return out
         else:
@@ -356,6 +503,20 @@ class RangeIndexedList:
         return fmt.format(name, self._bounds, self._copy_key, self._default,
             self._values)
 
+    def as_translate_dict(self):
+        """
+        Return a plain dict equivalent of the RangeIndexedList for use
+        with str.translate(), like dict().
+
+        The dict is built on the first call, and the same dict is
+        returned on every call after, until ranges are inserted; please
+        copy it before making changes.
+
+        """
+        if self._translate_dict is None:
+            self._translate_dict = self.dict()
+        return self._translate_dict
+
     def dict(self):
         """
         Return a Python dict equivalent of the RangeIndexedList.
@@ -369,9 +530,18 @@ class RangeIndexedList:
         # Lookups on a basic dict are much faster than with an RIL,
         # at the expense of memory usage.
         out = {}
-        for i in range(0, len(self._bounds), 2):
-            for kn in range(self._bounds[i], self._bounds[i+1]+1):
-                out[kn] = self.__getitem__(kn)
+        bounds = self._bounds
+        values = self._values
+        for i in range(0, len(bounds), 2):
+            if len(values) == 1:
+                v = values[0]
+            else:
+                v = values[i//2]
+            keys = range(bounds[i], bounds[i+1]+1)
+            if self._copy_key and isinstance(v, str) and (SUBPOINT in v):
+                out.update({kn: v.replace(SUBPOINT, chr(kn)) for kn in keys})
+            else:
+                out.update(dict.fromkeys(keys, v))
         return out
 
     def insert(self, new_keys, new_values=None):
@@ -408,27 +578,71 @@ class RangeIndexedList:
             msg = "number of values must be half the number of keys"
             raise ValueError(msg)
 
-        i = 0
-        for i_nk in range(1, len(new_keys), 2):
-            ks = new_keys[i_nk-1]    # range start key
-            ke = new_keys[i_nk]      # range end key
-            ist, ks_found = self._do_index(ks)
-            iend, ke_found = self._do_index(ke)
-
-            if ist != iend:
-                msg = "{}: new ranges must not overlap existing ranges".format(i)
-                raise ValueError(msg)
-            elif is_odd(ist) or ks_found or ke_found:
-                msg = "{}: cannot create new ranges within another".format(i)
-                raise ValueError(msg)
-            elif ke - ks < 1:
+        # merge the new ranges with the existing ranges, and check that
+        # all ranges are in order before making any changes; ranges
+        # are merged like (start, end, value, index in new_keys)
+        values = self._values
+        if len(values) == 1:
+            values = values * (len(self._bounds)//2)
+        pairs_old = zip(
+            self._bounds[0::2], self._bounds[1::2], values,
+            (None,) * len(values)
+        )
+        pairs_new = []
+        for i in range(len(new_keys)//2):
+            ks = new_keys[2*i]      # range start key
+            ke = new_keys[2*i+1]    # range end key
+            if ke - ks < 1:
                 msg = "{}: ranges must have a length of one or more".format(i)
                 raise ValueError(msg)
+            pairs_new.append((ks, ke, new_values[i], i))
+        # the existing ranges are already in order, so only the new
+        # ranges need sorting before the two are merged
+        pairs_new.sort(key=itemgetter(0))
+        merged = list(merge(pairs_old, pairs_new, key=itemgetter(0)))
+        for j in range(1, len(merged)):
+            pa = merged[j-1]
+            pb = merged[j]
+            if pb[0] <= pa[1]:
+                if pa[3] is None or pb[3] is None:
+                    i = pa[3] if pb[3] is None else pb[3]
+                    fmt = "{}: new ranges must not overlap existing ranges"
+                else:
+                    i = pb[3]
+                    fmt = "{}: new ranges must not overlap each other"
+                raise ValueError(fmt.format(i))
 
-            self._bounds.insert(ist, ke)
-            self._bounds.insert(ist, ks)
-            self._values.insert(iend//2, new_values[i_nk//2])
-            i += 1
+        # rebuild bounds and values from the merge, instead of shifting
+        # both lists for every new range
+        self._bounds = [k for p in merged for k in p[:2]]
+        self._values = [p[2] for p in merged]
+        self._translate_dict = None
+
+    def translate(self, s):
+        """
+        Return a copy of the str s with every character that falls within
+        a range replaced by its value. The result is the same as that of
+        s.translate(L), but the substitutions are performed by
+        str.translate() with a plain dict from as_translate_dict().
+
+        RILs covering more than TRANSLATE_DICT_LIMIT keys are not
+        converted to a dict; instead, each distinct code point in s is
+        looked up only once.
+
+        Where:
+        L = RangeIndexedList((97, 99), ('\ufffc\u20e0',), copy_key=True)
+
+        L.translate('abcd') == 'a\u20e0b\u20e0c\u20e0d'
+
+        """
+        table = self._translate_dict
+        if table is None:
+            bounds = self._bounds
+            size = sum(bounds[1::2]) - sum(bounds[0::2]) + len(bounds)//2
+            if size > self.TRANSLATE_DICT_LIMIT:
+                return translate_distinct(s, self)
+            table = self.as_translate_dict()
+        return s.translate(table)
 
     def remove(self, key):
         # TODO: This method will remove a range referred to by key.
@@ -532,19 +746,13 @@ class RangeIndexedList:
         greater side of the last range.
 
         """
-        i = bisect_right(self._bounds, key)
-        if i == 0:
-            if key != self._bounds[i]:
-                return (0, False)
-            else:
-                return (0, True)
-        elif i >= 1:
-            if key != self._bounds[i-1]:
-                return (i, False)
-            else:
-                return (i-1, True)
+        # bisect_right() places i after any bound equal to key
+        bounds = self._bounds
+        i = bisect_right(bounds, key)
+        if i > 0 and bounds[i-1] == key:
+            return (i-1, True)
         else:
-            raise(IndexError, 'unexpected negative index reached')
+            return (i, False)
 
 class TranslationDict(dict):
     """
@@ -557,7 +765,9 @@ class TranslationDict(dict):
       automatically without the need of the get() method
 
     * The default output value is the one returned by the empty
-      string '' key
+      string '' key. This value is returned as it was set, with any
+      U+FFFC characters left in place (e.g. '\ufffc?' and not '?');
+      this also applies to the '' key of get_dict().
 
     * Any output automatically inserts a copy of the key
       (or a Unicode character of the key's value for int keys)
@@ -571,6 +781,7 @@ class TranslationDict(dict):
 
     """
     _super = None
+    _maketrans = None
 
     def __init__(self, *args, **kwargs):
         self.out_default = SUBPOINT
@@ -585,29 +796,94 @@ class TranslationDict(dict):
             else:
                 raise TypeError('only dicts are supported as initialisers')
 
+    @property
+    def out_default(self):
+        return self._out_default
+
+    @out_default.setter
+    def out_default(self, value):
+        self._out_default = value
+        self._default_subst = isinstance(value, str) and (SUBPOINT in value)
+        self._default_copy = value == SUBPOINT
+        if self._default_subst:
+            # keys are joined with the pieces around the SUBPOINTs on
+            # lookup, which is quicker than replacing the SUBPOINTs
+            self._default_split = tuple(value.split(SUBPOINT))
+
     def __setitem__(self, key, value):
+        # PROTIP: copies of the key are inserted into values here, so
+        # that lookups on keys that are found never have to run any
+        # Python code; only the default output is processed on lookup,
+        # see __missing__()
+        self._maketrans = None
+        if key == '':
+            self.out_default = value
+            self._super.__setitem__('', value)
+            return
+        item = self._convert_item(key, value)
+        if item is not None:
+            self._super.__setitem__(*item)
+
+    @staticmethod
+    def _convert_item(key, value):
+        # Return the key and output as they are stored in the dict, or
+        # None if the key is not supported. The '' key is left to the
+        # callers, as it sets the default output.
         if isinstance(key, str):
-            if key == '':
-                self.out_default = value
-                self._super.__setitem__('', value)
-            elif len(key) == 1:
-                self._super.__setitem__(ord(key), value)
-            else:
-                self._super.__setitem__(key, value)
-        elif isinstance(key, int):
-            self._super.__setitem__(key, value)
-
-    def __getitem__(self, key):
-        out = self._super.get(key, self.out_default)
-        if out is None:
+            if len(key) == 1:
+                key = ord(key)
+        elif not isinstance(key, int):
             return None
-        if SUBPOINT in out:
-            keycopy = key
-            if isinstance(key, int):
-                keycopy = chr(key)
-            return out.replace(SUBPOINT, keycopy)
+        if isinstance(value, str):
+            if SUBPOINT in value:
+                keycopy = chr(key) if isinstance(key, int) else key
+                value = value.replace(SUBPOINT, keycopy)
+            # intern() refuses str subclasses
+            if type(value) is str:
+                value = intern(value)
+        return (key, value,)
+
+    def __delitem__(self, key):
+        self._maketrans = None
+        self._super.__delitem__(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        self._maketrans = None
+        self._super.clear()
+
+    def pop(self, *args):
+        self._maketrans = None
+        return self._super.pop(*args)
+
+    def popitem(self):
+        self._maketrans = None
+        return self._super.popitem()
+
+    def setdefault(self, key, default=None):
+        if isinstance(key, str) and len(key) == 1:
+            key = ord(key)
+        if key not in self:
+            self.__setitem__(key, default)
+        return self._super.get(key, default)
+
+    def update(self, *args, **kwargs):
+        # dict.update() and dict.setdefault() do not go through
+        # __setitem__(), so they are redone here to convert the items
+        for k, v in dict(*args, **kwargs).items():
+            self.__setitem__(k, v)
+
+    def __missing__(self, key):
+        if not self._default_subst:
+            return self._out_default
+        keycopy = chr(key) if isinstance(key, int) else key
+        if self._default_copy:
+            return keycopy
         else:
-            return out
+            return keycopy.join(self._default_split)
 
     def get_dict(self):
         """
@@ -615,10 +891,24 @@ class TranslationDict(dict):
 
         """
         # TODO: rename to dict() if feasible
-        temp = {}
-        for k in self.keys():
-            temp[k] = self.__getitem__(k)
-        return temp
+        return dict(self)
+
+    def to_maketrans(self):
+        """
+        Return a plain dict like those from str.maketrans(), containing
+        only the int keys of the TranslationDict and their outputs.
+
+        The default output is left out, so translating with this dict
+        is equivalent to translating with the TranslationDict only when
+        out_default is a lone SUBPOINT. The dict is shared between calls
+        until items are set or deleted.
+
+        """
+        out = self._maketrans
+        if out is None:
+            out = {k: v for k, v in self.items() if isinstance(k, int)}
+            self._maketrans = out
+        return out
 
     def reset_default(self):
         self.out_default = self.get('', SUBPOINT)
@@ -630,11 +920,20 @@ class TranslationDict(dict):
         dict.
         """
         # PROTIP: This seemingly redundant deep copy procedure actually
-        # performs a str.maketrans()-like conversion. It can also correctly
-        # set up default output.
+        # performs a str.maketrans()-like conversion. The conversion is
+        # shared with __setitem__(), but the converted items are added in
+        # bulk, and only the default output goes through __setitem__().
         out = self()
-        for k in d.keys():
-            out[k] = d[k]
+        items = {}
+        for k, v in d.items():
+            if k == '':
+                continue
+            item = self._convert_item(k, v)
+            if item is not None:
+                items[item[0]] = item[1]
+        dict.update(out, items)
+        if '' in d:
+            out[''] = d['']
         return out
 
 
@@ -665,11 +964,13 @@ class JSONRepo:
         self.current_db_name = None
         # Private variables
         self._repo_dir = None
-        self._current_trans = {}
+        self._trans_cache = {}
         self._used_maketrans = False  # TODO: remove this?
         self._tmp = []
-        self._filename_memo = []
-        self._fh = None
+        self._filename_memo = set()
+        self._path_memo = {}
+        self._db_cache = {}
+            # decoded DBs as (mtime_ns, size, dict) tuples, by file path
 
         self._set_repo_dir(repo_dir)
 
@@ -722,8 +1023,14 @@ class JSONRepo:
         into a single plain dict, placed first in the list of translation
         objects.
 
+        Translation lists are built once for every combination of
+        arguments, and are shared between calls until another database
+        is loaded; please copy them before making any changes.
+
         """
         # Summary of Handler Function mini-API
+        # Handlers are methods selected from JSONRepo._HANDLERS, and are
+        # called as unbound functions with the JSONRepo passed as self.
         # Arguments: (k, v, n, dls, **kwargs)
         #   k - key: mapping target from JSON translation database
         #   v - value: mapping replacement from JSON translation database
@@ -740,8 +1047,10 @@ class JSONRepo:
         #               different lookup types, but always results in int
         #               keys being applied.
         #
-        # PROTIP: The instance variables are set in the main loop, whose
-        #  code begins after the last handler function below.
+        # The main loop near the end of this method passes every mapping
+        # in the loaded databases to a handler, selected by the first
+        # character of the mapping's key. Databases are read into
+        # self._tmp beforehand by load_db().
         #
         first_dict = TranslationDict({})
         trans_dicts = [first_dict,]
@@ -760,16 +1069,10 @@ class JSONRepo:
             for t in trans_list:
                 if hasattr(t, 'dict'):
                     # handle types with dict() e.g. CodePointOffsetLookup
-                    tmp = t.dict()
-                    ktmp = tmp.keys()
-                    for k in ktmp:
-                        out[0][k] = tmp[k]
+                    out[0].update(t.dict())
                 elif hasattr(t, 'get_dict'):
                     # Handle types with get_dict() e.g. TranslationDict
-                    tmp = t.get_dict()
-                    ktmp = tmp.keys()
-                    for k in ktmp:
-                        out[0][k] = tmp[k]
+                    out[0].update(t.get_dict())
                 else:
                     out.append(t)
             if '' in out[0]:
@@ -778,15 +1081,16 @@ class JSONRepo:
                 out[0][''] = trans_list[0].out_default
             return out
 
-        handlers_k = {
-            self.CODE_OFFSET: self._prep_mapping_cpoff,
-            self.CODE_RANGE: self._prep_mapping_ril,
-            self.CODE_REGEX: self._prep_mapping_regex,
-        }
         ### End of Helper Functions ###
 
         if n is None:
             n = 0
+        cache_key = (n, maketrans, one_dict)
+        out = self._trans_cache.get(cache_key)
+        if out is not None:
+            return out
+        handlers = self._HANDLERS
+        prep_default = JSONRepo._prep_mapping
         for d in self._tmp:
             dmeta = d.get('meta', {})
             dtrans = d.get('trans', {})
@@ -797,21 +1101,43 @@ class JSONRepo:
                 fmt = '{}: use reverse-trans to specify reverse translations'
                 msg = fmt.format(dmeta[KEY_DB_NAME])
                 warn(msg, DeprecationWarning)
-            for k in dtrans.keys():
-                if k == '':
-                    handler = self._prep_mapping
-                elif isinstance(k, str):
-                    handler = handlers_k.get(k[0], self._prep_mapping)
-                else:
-                    handler = self._prep_mapping
+            for k, v in dtrans.items():
+                handler = handlers.get(k[:1], prep_default)
                 handler(
-                    k, dtrans[k], n, trans_dicts, maketrans=maketrans,
-                    reverse_trans=reverse_trans
+                    self, k, v, n, trans_dicts, dmeta=dmeta,
+                    maketrans=maketrans, reverse_trans=reverse_trans
                 )
         if one_dict:
-            return _prep_one_dict(trans_dicts)
+            out = _prep_one_dict(trans_dicts)
         else:
-            return trans_dicts
+            out = trans_dicts
+        self._trans_cache[cache_key] = out
+        return out
+
+    def get_translate_table(self, n=None):
+        """
+        Return a tuple like (table, regexes) to apply the translation
+        from the currently selected repository, where table is a single
+        dict-like that combines all lookups in the translation for use
+        with str.translate(), and regexes is a list of [re, repl,] lists
+        as returned by get_trans().
+
+        Apply the regexes first, then the table:
+
+        table, regexes = jr.get_translate_table()
+        for rege, repl in regexes:
+            s = rege.sub(repl, s)
+        s = s.translate(table)
+
+        The n parameter selects alternate translations, see get_trans().
+        Tables are built once for every value of n, and shared between
+        calls until another database is loaded.
+
+        """
+        trans = self.get_trans(n, one_dict=True)
+        if trans is None:
+            return None
+        return (trans[0], trans[1:])
 
     def _prep_mapping(self, k, v, n, dls, **kwargs):
         """
@@ -821,6 +1147,7 @@ class JSONRepo:
 
         Please see get_trans() for info on the other arguments
         """
+        dmeta = kwargs.get('dmeta', {})
         reverse_trans = kwargs.get('reverse_trans', False)
         maketrans = kwargs.get('maketrans', False)
         v_out = SUBPOINT
@@ -837,8 +1164,8 @@ class JSONRepo:
                     k = ord(k)
                 else:
                     fmt = "{}: multi-char keys unsupported with maketrans"
-                    msg = fmt.format(dmeta[KEY_DB_NAME])
-                    warn(RuntimeWarning, 'msg')
+                    msg = fmt.format(dmeta.get(KEY_DB_NAME))
+                    warn(msg, RuntimeWarning)
                 return
         if reverse_trans:
             if k == '':
@@ -898,11 +1225,12 @@ class JSONRepo:
 
         Please see get_trans() for info on the other arguments
         """
+        dmeta = kwargs.get('dmeta', {})
         reverse_trans = kwargs.get('reverse_trans', False)
         if reverse_trans:
             fmt = "{}: reverse regex translations unsupported"
-            msg = fmt.format(dmeta[KEY_DB_NAME])
-            warn(RuntimeWarning, msg)
+            msg = fmt.format(dmeta.get(KEY_DB_NAME))
+            warn(msg, RuntimeWarning)
             return
         it = n
         if isinstance(v[0], list):
@@ -912,7 +1240,7 @@ class JSONRepo:
             args = v[it]
         else:
             args = v
-        rege = re.compile(args[0])
+        rege = compile_re(args[0])
         repl = args[1]
         out = [rege, repl]
         dls.append(out)
@@ -935,14 +1263,15 @@ class JSONRepo:
 
         Please see get_trans() for info on the other arguments
         """
+        dmeta = kwargs.get('dmeta', {})
         reverse_trans = kwargs.get('reverse_trans', False)
         if reverse_trans:
             # TODO: Code point ranges are actually easily
             # reversed... maybe implement a reverse method, or
             # even check if the reversal method has been implemented?
             fmt = "{}: reverse range translations unsupported"
-            msg = fmt.format(dmeta[KEY_DB_NAME])
-            warn(RuntimeWarning, msg)
+            msg = fmt.format(dmeta.get(KEY_DB_NAME))
+            warn(msg, RuntimeWarning)
             return
         it = n
         if isinstance(v[0][0], (list, tuple)):
@@ -957,6 +1286,15 @@ class JSONRepo:
         ril = RangeIndexedList(bs, vs, copy_key=True)
         dls.append(ril)
 
+    # Handler functions for translations with special names, selected by
+    # the first character of the name; all other translations are handled
+    # by _prep_mapping(). See get_trans() for details.
+    _HANDLERS = {
+        CODE_OFFSET: _prep_mapping_cpoff,
+        CODE_RANGE: _prep_mapping_ril,
+        CODE_REGEX: _prep_mapping_regex,
+    }
+
     def _set_repo_dir(self, rdpath):
         db_names = self.list_trans(rdpath)
         if len(db_names) <= 0:
@@ -964,6 +1302,7 @@ class JSONRepo:
             raise FileNotFoundError(msg)
         else:
             self._repo_dir = rdpath
+            self._path_memo.clear()
 
     def list_trans(self, rdpath=None, incl='names'):
         """
@@ -1028,62 +1367,87 @@ class JSONRepo:
         repository, importing other files linked with the 'trans-include'
         keyword as necessary.
 
-        This method launches the recursive linking process, and performs
-        the necesary cleanups that must be excluded from the recursive
-        loading process.
+        This method launches the linking process, and performs the
+        necesary cleanups that must be excluded from the loading process.
 
         """
         if self._repo_dir is None:
             raise NotADirectoryError('repository directory not set')
-        self._current_trans = None
+        self._trans_cache.clear()
         self._tmp.clear()
         self._filename_memo.clear()
         self.current_db_name = None
-        try:
-            self._do_load_trans(name)
-            self.current_db_name = name
-        finally:
-            if self._fh is not None:
-                self._fh.close()
-                self._fh = None
+        self._do_load_trans(name)
+        self.current_db_name = name
 
     def _do_load_trans(self, name):
         """
-        Performs the recursive process of reading in data from a database
-        files, together with other inclusion-referenced database files.
-        The results are cached in self._tmp.
+        Reads in data from a database file, together with other
+        inclusion-referenced database files. The results are cached in
+        self._tmp, with the last file read first.
+
+        Inclusions are followed depth-first, in the order they appear
+        in each file. A stack is used instead of recursion, so deep
+        chains of inclusions do not run into Python's recursion limit.
 
         This method is intended to be called from load_trans() only.
 
         """
-        tmp_path = self._get_db_path(name)
-        if self._fh is not None:
-            self._fh.close()
-        self._fh = open(tmp_path, mode='r', encoding='utf-8')
-        jd = JSONDecoder()
-        tmp_dict = jd.decode(self._fh.read())
-        # insert runtime metadata
-        tmp_dict['meta'][KEY_DB_NAME] = name
-        ##
-        self._tmp.insert(0, tmp_dict)
-        self._filename_memo.insert(0, name)
-        incs = self._tmp[0].get('trans-include', [])
-        if len(incs) > 0:
+        stack = [(name, iter(self._read_db(name).get('trans-include', [])))]
+        while len(stack) > 0:
+            parent, incs = stack[-1]
             for e in incs:
-                if e == name:
+                if e == parent:
                     fmt = 'trans-include: {}: cannot include self'
-                    msg = fmt.format(name)
+                    msg = fmt.format(parent)
                     warn(msg, RuntimeWarning)
                 elif e in self._filename_memo:
                     fmt = 'trans-include: {} to {}: inclusion loop detected'
-                    msg = fmt.format(name, e)
+                    msg = fmt.format(parent, e)
                     warn(msg, RuntimeWarning)
                 else:
-                    self._do_load_trans(e)
+                    e_incs = self._read_db(e).get('trans-include', [])
+                    stack.append((e, iter(e_incs)))
+                    break
+            else:
+                # all inclusions of parent have been followed
+                stack.pop()
+        self._tmp.reverse()
+
+    def _read_db(self, name):
+        """
+        Reads in data from a single database file, and adds it to
+        self._tmp. Returns the database as a dict.
+
+        This method is intended to be called from _do_load_trans() only.
+
+        """
+        name = intern(name)
+        tmp_path = self._get_db_path(name)
+        # only decode DBs again if their files have changed
+        st = stat(tmp_path)
+        cached = self._db_cache.get(tmp_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            tmp_dict = cached[2]
+        else:
+            with open(tmp_path, mode='rb') as fh:
+                tmp_dict = load_json(fh.read())
+            # insert runtime metadata
+            tmp_dict['meta'][KEY_DB_NAME] = name
+            ##
+            self._db_cache[tmp_path] = (st.st_mtime_ns, st.st_size, tmp_dict)
+        self._tmp.append(tmp_dict)
+        self._filename_memo.add(name)
+        return tmp_dict
 
     def _get_db_path(self, name):
-        filename = name + SUFFIX_JSON
-        return path.join(self._repo_dir, filename)
+        try:
+            return self._path_memo[name]
+        except KeyError:
+            filename = name + SUFFIX_JSON
+            out = path.join(self._repo_dir, filename)
+            self._path_memo[name] = out
+            return out
 
     def _dump_trans(self, full=False):
         # TODO: Return all possible translation dictionaries available.
@@ -1123,6 +1487,8 @@ class TextProcessor:
         self.trans_dicts = {}
         self.trans_ops_list = []
         self.meta = {}
+        self._composed = {}
+            # composed tables as (tables, composed) tuples, see translate()
 
     def add_repo(self, repo):
         """
@@ -1184,6 +1550,7 @@ class TextProcessor:
             raise KeyError(f"translation {trans_name} not found in any repo")
         else:
             k = f"{repo_name}{self.FQ_SEP}{tname}.{n}"
+            self._composed.clear()
             self.trans_dicts[k] = repo.get_trans(n=n, one_dict=True)
             self.meta[k] = repo.get_meta()
 
@@ -1219,6 +1586,7 @@ class TextProcessor:
     def clear_trans(self):
         self.trans_dicts.clear()
         self.trans_ops_list.clear()
+        self._composed.clear()
 
     def list_repos(self, incl='valid'):
         """
@@ -1328,30 +1696,70 @@ class TextProcessor:
         indices. Dictionary names must be taken from the keys of
         self.trans_dicts, while indices refer to the n-th dictionary added.
 
+        Translation dicts must not be changed in place. Successive plain
+        dicts are composed into a single dict, which is kept under the
+        ids of the dicts until add_trans_dict() or clear_trans() is next
+        used. These dicts are also shared with the repositories, so a
+        dict changed in place leaves a stale composed dict behind.
+
         """
         if len(order) == 0:
             olist = self.trans_ops_list
         else:
             olist = [key_by_index(self.trans_dicts, i) for i in order]
 
+        # PROTIP: lookups that can be performed with plain dicts are
+        # held back in tables, so that successive lookups can be composed
+        # into a single dict, and performed in a single pass
         out = s
+        tables = []
         for tn in olist:
             tdata = self.trans_dicts[tn]
             if len(tdata) > 1:
                 # handle regex preprocessing if defined
                 for p in tdata[1:]:
                     if type(p[0]) is re.Pattern:
+                        out = self._translate_tables(out, tables)
                         out = (p[0]).sub(p[1],out)
 
             # now handle lookup-based translations
             tdict = tdata[0]
             if self.meta[tn].get('reverse-out', False):
                 # handle reversed output
-                tmp_rev = ''
-                for c in out:
-                    tmp_rev = ''.join((tdict.get(ord(c), c), tmp_rev))
-                    out = tmp_rev
+                out = self._translate_tables(out, tables)
+                tdict_get = tdict.get
+                out = ''.join([tdict_get(ord(c), c) for c in reversed(out)])
+            elif type(tdict) is dict:
+                tables.append(tdict)
+            elif isinstance(tdict, TranslationDict)\
+                    and tdict.out_default == SUBPOINT:
+                tables.append(tdict.to_maketrans())
             else:
-                out = out.translate(tdict)
-        return out
+                out = self._translate_tables(out, tables)
+                out = translate_distinct(out, tdict)
+        return self._translate_tables(out, tables)
+
+    def _translate_tables(self, s, tables):
+        """
+        Translate s with all plain dicts in tables in one pass, and
+        empty tables. Composed dicts are kept for later calls.
+
+        This method is intended to be called from translate() only.
+
+        """
+        if len(tables) == 0:
+            return s
+        elif len(tables) == 1:
+            table = tables[0]
+        else:
+            # the tables are kept with the composed dict, so that their
+            # ids cannot be reused by other tables
+            key = tuple(id(t) for t in tables)
+            cached = self._composed.get(key)
+            if cached is None:
+                cached = (tuple(tables), compose_translate_dicts(tables))
+                self._composed[key] = cached
+            table = cached[1]
+        tables.clear()
+        return s.translate(table)
 